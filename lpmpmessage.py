@@ -25,7 +25,13 @@ import urwid
 from lpshipit import (
     build_commit_msg,
     _format_git_branch_name,
+    _format_lp_name_from_link,
     _get_launchpad_client,
+    _get_lp_collection_entries,
+    _get_lp_display_name,
+    _get_lp_json,
+    _get_merge_proposals,
+    _parse_lp_datetime,
     _set_urwid_widget,
 )
 # Global var to store the chosen MP's commit message
@@ -37,51 +43,59 @@ def summarize_all_mps(mps):
     for mp in mps:
         review_vote_parts = []
         approval_count = 0
-        for vote in mp.votes:
-            if not vote.is_pending:
-                review_vote_parts.append(vote.reviewer.name)
-                if vote.comment.vote == 'Approve':
-                    approval_count += 1
-
-        description = '' if not mp.description else mp.description
-        commit_message = description if not mp.commit_message \
-            else mp.commit_message
-
-        short_commit_message = '' if not commit_message \
-            else commit_message.splitlines()[0]
-
-        if getattr(mp, 'source_git_repository', None):
-            source_repo = '{}/'.format(mp.source_git_repository.display_name)
-            target_repo = '{}/'.format(mp.target_git_repository.display_name)
-            source_branch = _format_git_branch_name(mp.source_git_path)
-            target_branch = _format_git_branch_name(mp.target_git_path)
+        for vote in _get_lp_collection_entries(mp['votes_collection_link']):
+            # is_pending and the links are part of the vote representation
+            # but the comment is a separate request so only fetch it when
+            # needed
+            if vote['is_pending']:
+                continue
+            review_vote_parts.append(
+                    _format_lp_name_from_link(vote['reviewer_link']))
+            if vote['comment_link'] and \
+                    _get_lp_json(vote['comment_link'])['vote'] == 'Approve':
+                approval_count += 1
+
+        description = mp['description'] or ''
+        commit_message = mp['commit_message'] or description
+
+        # Only the first line is needed so avoid splitting the whole message
+        short_commit_message = commit_message.split('\n', 1)[0].rstrip('\r')
+
+        if mp['source_git_repository_link']:
+            source_repo = '{}/'.format(
+                    _get_lp_display_name(mp['source_git_repository_link']))
+            target_repo = '{}/'.format(
+                    _get_lp_display_name(mp['target_git_repository_link']))
+            source_branch = _format_git_branch_name(mp['source_git_path'])
+            target_branch = _format_git_branch_name(mp['target_git_path'])
         else:
             source_repo = ''
             target_repo = ''
-            source_branch = mp.source_branch.display_name
-            target_branch = mp.target_branch.display_name
+            source_branch = _get_lp_display_name(mp['source_branch_link'])
+            target_branch = _get_lp_display_name(mp['target_branch_link'])
 
+        reviewers = sorted(review_vote_parts)
         mp_summary = {
-            'author': mp.registrant.name,
+            'author': _format_lp_name_from_link(mp['registrant_link']),
             'commit_message': commit_message,
             'short_commit_message': short_commit_message,
-            'reviewers': sorted(review_vote_parts),
+            'reviewers': reviewers,
+            'reviewers_str': ",".join(reviewers),
             'approval_count': approval_count,
-            'web': mp.web_link,
+            'web': mp['web_link'],
             'target_branch': target_branch,
             'source_branch': source_branch,
             'target_repo': target_repo,
             'source_repo': source_repo,
-            'date_created': mp.date_created
+            'date_created': _parse_lp_datetime(mp['date_created'])
         }
 
         summary = "{source_repo}{source_branch}" \
                   "\n->{target_repo}{target_branch}" \
                   "\n    {short_commit_message}" \
-                  "\n    {approval_count} approvals ({str_reviewers})" \
+                  "\n    {approval_count} approvals ({reviewers_str})" \
                   "\n    {date_created} - {web}" \
-            .format(**mp_summary, str_reviewers=","
-                    .join(mp_summary['reviewers']))
+            .format(**mp_summary)
 
         mp_summary['summary'] = summary
 
@@ -103,8 +117,8 @@ def lpmpmessage(mp_owner, debug):
     lp_user = lp.me
 
     print('Retrieving Merge Proposals from Launchpad...')
-    person = lp.people[lp_user.name if mp_owner is None else mp_owner]
-    mps = person.getMergeProposals(status=['Needs review', 'Approved'])
+    mps = _get_merge_proposals(
+            lp_user, lp_user.name if mp_owner is None else mp_owner)
     if debug:
         print('Debug: Launchad returned {} merge proposals'.format(len(mps)))
     mp_summaries = summarize_all_mps(mps)
@@ -117,8 +131,7 @@ def lpmpmessage(mp_owner, debug):
             global MP_MESSAGE_OUTPUT
             MP_MESSAGE_OUTPUT = build_commit_msg(
                     author=chosen_mp['author'],
-                    reviewers=",".join(
-                            chosen_mp['reviewers']),
+                    reviewers_str=chosen_mp['reviewers_str'],
                     source_branch=chosen_mp['source_branch'],
                     target_branch=chosen_mp['target_branch'],
                     commit_message=chosen_mp[
@@ -127,14 +140,14 @@ def lpmpmessage(mp_owner, debug):
             )
             raise urwid.ExitMainLoop()
 
-        listwalker = urwid.SimpleFocusListWalker(list())
-        listwalker.append(urwid.Text(u'Merge Proposal to Merge'))
-        listwalker.append(urwid.Divider())
-
+        buttons = []
         for mp in mp_summaries:
             button = urwid.Button(mp['summary'])
             urwid.connect_signal(button, 'click', mp_chosen, mp)
-            listwalker.append(button)
+            buttons.append(button)
+        listwalker = urwid.SimpleFocusListWalker(
+                [urwid.Text(u'Merge Proposal to Merge'), urwid.Divider(),
+                 *buttons])
         mp_box = urwid.ListBox(listwalker)
         try:
             _set_urwid_widget(mp_box, urwid_exit_on_q)
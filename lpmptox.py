@@ -20,7 +20,6 @@ Activate your virtualenv and install the requirements::
 
 """
 import click
-import git
 import os
 import subprocess
 from tempfile import TemporaryDirectory
@@ -28,6 +27,7 @@ import urwid
 
 from lpshipit import (
     _get_launchpad_client,
+    _get_merge_proposals,
     _set_urwid_widget,
     summarize_git_mps,
 )
@@ -39,6 +39,9 @@ CHOSEN_MP = None
 def runtox(source_repo, source_branch,
            tox_command='tox --recreate --parallel auto',
            output_filepath=os.devnull):
+    # GitPython is slow to import so is only imported once it is needed
+    import git
+
     with open(output_filepath, "a") as output_file:
         with TemporaryDirectory() as local_repo:
             debug_message = 'Cloning {} (branch {}) in to tmp directory {} ...'.format(
@@ -79,8 +82,8 @@ def lpmptox(mp_owner, debug):
     lp_user = lp.me
 
     print('Retrieving Merge Proposals from Launchpad...')
-    person = lp.people[lp_user.name if mp_owner is None else mp_owner]
-    mps = person.getMergeProposals(status=['Needs review', 'Approved'])
+    mps = _get_merge_proposals(
+            lp_user, lp_user.name if mp_owner is None else mp_owner)
     if debug:
         print('Debug: Launchad returned {} merge proposals'.format(len(mps)))
     mp_summaries = summarize_git_mps(mps)
@@ -97,14 +100,14 @@ def lpmptox(mp_owner, debug):
 
             raise urwid.ExitMainLoop()
 
-        listwalker = urwid.SimpleFocusListWalker(list())
-        listwalker.append(urwid.Text(u'Merge Proposal to Merge'))
-        listwalker.append(urwid.Divider())
-
+        buttons = []
         for mp in mp_summaries:
             button = urwid.Button(mp['summary'])
             urwid.connect_signal(button, 'click', mp_chosen, mp)
-            listwalker.append(button)
+            buttons.append(button)
+        listwalker = urwid.SimpleFocusListWalker(
+                [urwid.Text(u'Merge Proposal to Merge'), urwid.Divider(),
+                 *buttons])
         mp_box = urwid.ListBox(listwalker)
         try:
             _set_urwid_widget(mp_box, urwid_exit_on_q)
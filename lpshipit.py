@@ -22,19 +22,49 @@ Activate your virtualenv and install the requirements::
 
 `pip install -r requirements.txt`
 
+launchpadlib's on-disk cache of Launchpad responses, including the API
+description (WADL), is kept in ``~/.cache/launchpadlib`` rather than
+launchpadlib's default of ``~/.launchpadlib``. How long entries are reused
+follows the caching headers Launchpad sends. The directory can be removed at
+any time to clear the cache, and a ``~/.launchpadlib`` left by earlier
+versions of lpshipit is no longer used.
 
 """
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import NamedTemporaryFile
+from urllib.parse import quote, urlencode
 
 import click
-import git
+import simplejson
 import urwid
 
-from launchpadlib.launchpad import Launchpad
-from launchpadlib.credentials import UnencryptedFileCredentialStore
-
 URWID_MAIN_LOOP = None
 
+# Launchpad clients already logged in to, keyed by credential file location
+LAUNCHPAD_CLIENTS = {}
+
+# HTTP connections to Launchpad used by the current thread
+LAUNCHPAD_BROWSERS = threading.local()
+
+# Directory used by launchpadlib to cache responses from Launchpad
+LAUNCHPAD_CACHE_DIR = os.path.expanduser('~/.cache/launchpadlib')
+
+# Directory, within LAUNCHPAD_CACHE_DIR, that launchpadlib keeps the HTTP
+# cache for the production service root in
+LAUNCHPAD_HTTP_CACHE_DIR = os.path.join(LAUNCHPAD_CACHE_DIR,
+                                        'api.launchpad.net', 'cache')
+
+# Display names of Launchpad entries already fetched, keyed by entry link
+LAUNCHPAD_DISPLAY_NAMES = {}
+
+# Number of entries requested per page of a Launchpad collection
+LAUNCHPAD_PAGE_SIZE = 300
+
+# Number of threads used to retrieve merge proposal details from Launchpad
+LAUNCHPAD_MAX_WORKERS = 16
+
 
 def _set_urwid_widget(widget, unhandled_input):
     global URWID_MAIN_LOOP
@@ -47,10 +77,41 @@ def _set_urwid_widget(widget, unhandled_input):
 
 
 def _get_launchpad_client():
+    # launchpadlib is slow to import so is only imported once a client is
+    # needed, keeping --help and other early exits fast
+    from launchpadlib.launchpad import Launchpad
+    from launchpadlib.credentials import UnencryptedFileCredentialStore
+
     cred_location = os.path.expanduser('~/.lp_creds')
-    credential_store = UnencryptedFileCredentialStore(cred_location)
-    return Launchpad.login_with('cpc', 'production', version='devel',
-                                credential_store=credential_store)
+    if cred_location not in LAUNCHPAD_CLIENTS:
+        credential_store = UnencryptedFileCredentialStore(cred_location)
+        LAUNCHPAD_CLIENTS[cred_location] = Launchpad.login_with(
+                'cpc', 'production', version='devel',
+                launchpadlib_dir=LAUNCHPAD_CACHE_DIR,
+                credential_store=credential_store)
+    return LAUNCHPAD_CLIENTS[cred_location]
+
+
+def _get_lp_browser():
+    # launchpadlib clients can not be shared between threads, and logging in
+    # again on each thread would load and parse the whole API description
+    # (WADL). Each thread instead gets its own lazr.restfulclient Browser,
+    # signed with the credentials of the single logged in client and sharing
+    # its on-disk cache.
+    #
+    # Browser, the client's _browser attribute and httpFactory are not
+    # public launchpadlib API. This is the only place they are used and was
+    # checked against lazr.restfulclient 0.13.5 and 4.0.0, as used by
+    # launchpadlib 1.10 to 2.2.
+    browser = getattr(LAUNCHPAD_BROWSERS, 'browser', None)
+    if browser is None:
+        from lazr.restfulclient._browser import Browser
+
+        lp = _get_launchpad_client()
+        browser = Browser(lp, lp.credentials, cache=LAUNCHPAD_HTTP_CACHE_DIR,
+                          user_agent=lp._browser.user_agent)
+        LAUNCHPAD_BROWSERS.browser = browser
+    return browser
 
 
 def _format_git_branch_name(branch_name):
@@ -59,55 +120,120 @@ def _format_git_branch_name(branch_name):
     return branch_name
 
 
+def _format_lp_name_from_link(person_link):
+    # Person links look like https://api.launchpad.net/devel/~name so the
+    # name can be read from the link without fetching the person entry
+    return person_link.rstrip('/').rsplit('/~', 1)[-1]
+
+
+def _get_lp_json(link, **params):
+    # Launchpad is queried for plain JSON representations, using the
+    # current thread's browser, rather than through launchpadlib's entry
+    # objects which make a request per attribute
+    if params:
+        link = '{}?{}'.format(link, urlencode(params, doseq=True,
+                                              quote_via=quote))
+    return simplejson.loads(_get_lp_browser().get(link))
+
+
+def _get_lp_collection_entries(link, **params):
+    params['ws.size'] = LAUNCHPAD_PAGE_SIZE
+    page = _get_lp_json(link, **params)
+    entries = page['entries']
+    while page.get('next_collection_link'):
+        page = _get_lp_json(page['next_collection_link'])
+        entries.extend(page['entries'])
+    return entries
+
+
+def _parse_lp_datetime(value):
+    # JSON representations have ISO 8601 date strings. wadllib's parser is
+    # what launchpadlib uses for entry attributes so dates display as they
+    # did when read through launchpadlib.
+    from wadllib.iso_strptime import iso_strptime
+
+    return iso_strptime(value)
+
+
+def _get_lp_display_name(link):
+    # Many MPs share a target repository so display names are only fetched
+    # once per link
+    if link not in LAUNCHPAD_DISPLAY_NAMES:
+        LAUNCHPAD_DISPLAY_NAMES[link] = _get_lp_json(link)['display_name']
+    return LAUNCHPAD_DISPLAY_NAMES[link]
+
+
+def _get_merge_proposals(lp_user, person_name):
+    # Person links only differ by the name after the ~ so the link for
+    # person_name can be built from the logged in user's link
+    service_root = lp_user.self_link.rstrip('/').rsplit('/~', 1)[0]
+    person_link = '{}/~{}'.format(service_root, person_name)
+    return _get_lp_collection_entries(person_link,
+                                      status=['Needs review', 'Approved'],
+                                      **{'ws.op': 'getMergeProposals'})
+
+
+def _summarize_git_mp(mp):
+    review_vote_parts = []
+    approval_count = 0
+    for vote in _get_lp_collection_entries(mp['votes_collection_link']):
+        # is_pending and the links are part of the vote representation but
+        # the comment is a separate request so only fetch it when needed
+        if vote['is_pending'] or not vote['comment_link']:
+            continue
+        if _get_lp_json(vote['comment_link'])['vote'] == 'Approve':
+            review_vote_parts.append(
+                    _format_lp_name_from_link(vote['reviewer_link']))
+            approval_count += 1
+
+    source_branch = _format_git_branch_name(mp['source_git_path'])
+    target_branch = _format_git_branch_name(mp['target_git_path'])
+
+    description = mp['description'] or ''
+    commit_message = mp['commit_message'] or description
+
+    # Only the first line is needed so avoid splitting the whole message
+    short_commit_message = commit_message.split('\n', 1)[0].rstrip('\r')
+
+    reviewers = sorted(review_vote_parts)
+    mp_summary = {
+        'author': _format_lp_name_from_link(mp['registrant_link']),
+        'commit_message': commit_message,
+        'short_commit_message': short_commit_message,
+        'reviewers': reviewers,
+        'reviewers_str': ",".join(reviewers),
+        'approval_count': approval_count,
+        'web': mp['web_link'],
+        'target_branch': target_branch,
+        'source_branch': source_branch,
+        'target_repo': _get_lp_display_name(
+                mp['target_git_repository_link']),
+        'source_repo': _get_lp_display_name(
+                mp['source_git_repository_link']),
+        'date_created': _parse_lp_datetime(mp['date_created'])
+    }
+
+    summary = "{source_repo}/{source_branch}" \
+              "\n->{target_repo}/{target_branch}" \
+              "\n    {short_commit_message}" \
+              "\n    {approval_count} approvals ({reviewers_str})" \
+              "\n    {date_created} - {web}" \
+        .format(**mp_summary)
+
+    mp_summary['summary'] = summary
+
+    return mp_summary
+
+
 def summarize_git_mps(mps):
-    mp_content = []
-    for mp in mps:
-        if getattr(mp, 'source_git_repository', None):
-            review_vote_parts = []
-            approval_count = 0
-            for vote in mp.votes:
-                if not vote.is_pending:
-                    if vote.comment.vote == 'Approve':
-                        review_vote_parts.append(vote.reviewer.name)
-                        approval_count += 1
-
-            source_repo = mp.source_git_repository
-            target_repo = mp.target_git_repository
-            source_branch = _format_git_branch_name(mp.source_git_path)
-            target_branch = _format_git_branch_name(mp.target_git_path)
-
-            description = '' if not mp.description else mp.description
-            commit_message = description if not mp.commit_message \
-                else mp.commit_message
-
-            short_commit_message = '' if not commit_message \
-                else commit_message.splitlines()[0]
-
-            mp_summary = {
-                'author': mp.registrant.name,
-                'commit_message': commit_message,
-                'short_commit_message': short_commit_message,
-                'reviewers': sorted(review_vote_parts),
-                'approval_count': approval_count,
-                'web': mp.web_link,
-                'target_branch': target_branch,
-                'source_branch': source_branch,
-                'target_repo': target_repo.display_name,
-                'source_repo': source_repo.display_name,
-                'date_created': mp.date_created
-            }
-
-            summary = "{source_repo}/{source_branch}" \
-                      "\n->{target_repo}/{target_branch}" \
-                      "\n    {short_commit_message}" \
-                      "\n    {approval_count} approvals ({str_reviewers})" \
-                      "\n    {date_created} - {web}" \
-                .format(**mp_summary, str_reviewers=","
-                        .join(mp_summary['reviewers']))
-
-            mp_summary['summary'] = summary
-
-            mp_content.append(mp_summary)
+    # MPs for bzr branches have no source git repository link so are skipped
+    # before any further requests are made for them
+    git_mps = [mp for mp in mps if mp['source_git_repository_link']]
+
+    # Each MP needs several dependent requests to Launchpad so MPs are
+    # summarized concurrently
+    with ThreadPoolExecutor(max_workers=LAUNCHPAD_MAX_WORKERS) as executor:
+        mp_content = list(executor.map(_summarize_git_mp, git_mps))
 
     sorted_mps = sorted(mp_content,
                         key=lambda k: k['date_created'],
@@ -115,12 +241,226 @@ def summarize_git_mps(mps):
     return sorted_mps
 
 
-def build_commit_msg(author, reviewers, source_branch, target_branch,
+def build_commit_msg(author, reviewers_str, source_branch, target_branch,
                      commit_message, mp_web_link):
     """Builds the agreed convention merge commit message"""
     return "Merge {} into {} [a={}] [r={}]\n\n{}\n\nMP: {}".format(
         source_branch, target_branch, author,
-        reviewers, commit_message, mp_web_link)
+        reviewers_str, commit_message, mp_web_link)
+
+
+class BranchListWalker(urwid.ListWalker):
+    """List of buttons for choosing a local branch.
+
+    Repositories can have thousands of branches so each button is only
+    created when the list box first displays it.
+    """
+
+    def __init__(self, title, local_branches, callback, user_args):
+        self.header = [urwid.Text(title), urwid.Divider()]
+        self.local_branches = local_branches
+        self.callback = callback
+        self.user_args = user_args
+        self.buttons = {}
+        self.focus = 0
+
+    def __len__(self):
+        return len(self.header) + len(self.local_branches)
+
+    def __getitem__(self, position):
+        if position < 0 or position >= len(self):
+            raise IndexError(position)
+        if position < len(self.header):
+            return self.header[position]
+        if position not in self.buttons:
+            local_branch = self.local_branches[position - len(self.header)]
+            button = urwid.Button(local_branch)
+            urwid.connect_signal(button, 'click', self.callback,
+                                 local_branch, user_args=[self.user_args])
+            self.buttons[position] = button
+        return self.buttons[position]
+
+    def set_focus(self, position):
+        self.focus = position
+        self._modified()
+
+    def next_position(self, position):
+        if position + 1 >= len(self):
+            raise IndexError(position)
+        return position + 1
+
+    def prev_position(self, position):
+        if position <= 0:
+            raise IndexError(position)
+        return position - 1
+
+    def positions(self, reverse=False):
+        if reverse:
+            return range(len(self) - 1, -1, -1)
+        return range(len(self))
+
+
+def _urwid_exit_on_q(key):
+    if key in ('q', 'Q'):
+        raise urwid.ExitMainLoop()
+
+
+def _urwid_exit_program(button):
+    raise urwid.ExitMainLoop()
+
+
+def _target_branch_chosen(user_args, button, target_branch):
+    source_branch, chosen_mp, repo, branch_indexes = \
+        user_args['source_branch'], \
+        user_args['chosen_mp'], \
+        user_args['repo'], \
+        user_args['branch_indexes']
+
+    # Only the target branch is checked out so it must be a local branch,
+    # the source branch can be anything git merge accepts
+    if target_branch not in branch_indexes:
+        error_text = urwid.Text('{} is not a local branch. '
+                                '\n\nPress Q to exit.'
+                                .format(target_branch))
+        error_box = urwid.Filler(error_text, 'top')
+        _set_urwid_widget(error_box, _urwid_exit_on_q)
+    elif target_branch != source_branch:
+        commit_message = build_commit_msg(
+                author=chosen_mp['author'],
+                reviewers_str=chosen_mp['reviewers_str'],
+                source_branch=source_branch,
+                target_branch=target_branch,
+                commit_message=chosen_mp['commit_message'],
+                mp_web_link=chosen_mp['web']
+        )
+
+        repo.branches[target_branch].checkout()
+
+        # The commit message includes the MP description which can be long
+        # so it is passed in a file rather than as an argument
+        with NamedTemporaryFile('w', encoding='utf-8') as commit_message_file:
+            commit_message_file.write(commit_message)
+            commit_message_file.flush()
+            repo.git.merge('--no-ff', source_branch,
+                           '--file={}'.format(commit_message_file.name))
+
+        merge_summary = "{source_branch} has been merged " \
+                        "in to {target_branch} \nChanges " \
+                        "have _NOT_ been pushed".format(
+                                source_branch=source_branch,
+                                target_branch=target_branch
+                        )
+
+        button = urwid.Button("Exit")
+        urwid.connect_signal(button, 'click', _urwid_exit_program)
+        merge_summary_listwalker = urwid.SimpleFocusListWalker([
+                urwid.Text(u'Merge Summary'),
+                urwid.Divider(),
+                urwid.Text(merge_summary),
+                urwid.Divider(),
+                button])
+        merge_summary_box = urwid.ListBox(merge_summary_listwalker)
+        _set_urwid_widget(merge_summary_box, _urwid_exit_on_q)
+    else:
+        error_text = urwid.Text('Source branch and target '
+                                'branch can not be the same. '
+                                '\n\nPress Q to exit.')
+        error_box = urwid.Filler(error_text, 'top')
+        _set_urwid_widget(error_box, _urwid_exit_on_q)
+
+
+def _source_branch_chosen(user_args, button, chosen_source_branch):
+    chosen_mp, target_branch, checkedout_name, local_branches, \
+        branch_indexes = \
+        user_args['chosen_mp'], \
+        user_args['target_branch'], \
+        user_args['checkedout_name'], \
+        user_args['local_branches'], \
+        user_args['branch_indexes']
+
+    user_args = dict(user_args, source_branch=chosen_source_branch)
+    if not target_branch:
+        target_branch_listwalker = BranchListWalker(
+                u'Target Branch', local_branches, _target_branch_chosen,
+                user_args)
+        # Focus the MP's target branch, or the checked out branch if the MP's
+        # branch is not available locally. Branch buttons come after the
+        # title and divider.
+        focus = branch_indexes.get(chosen_mp['target_branch'],
+                                   branch_indexes.get(checkedout_name))
+        if focus is not None:
+            target_branch_listwalker.set_focus(focus + 2)
+
+        target_branch_box = urwid.ListBox(target_branch_listwalker)
+        _set_urwid_widget(target_branch_box, _urwid_exit_on_q)
+    else:
+        _target_branch_chosen(user_args, None, target_branch)
+
+
+def _mp_chosen(user_args, button, chosen_mp):
+    source_branch, checkedout_name, local_branches, branch_indexes = \
+        user_args['source_branch'], \
+        user_args['checkedout_name'], \
+        user_args['local_branches'], \
+        user_args['branch_indexes']
+
+    user_args = dict(user_args, chosen_mp=chosen_mp)
+    if not source_branch:
+        source_branch_listwalker = BranchListWalker(
+                u'Source Branch', local_branches, _source_branch_chosen,
+                user_args)
+        # Focus the MP's source branch, or the checked out branch if the MP's
+        # branch is not available locally. Branch buttons come after the
+        # title and divider.
+        focus = branch_indexes.get(chosen_mp['source_branch'],
+                                   branch_indexes.get(checkedout_name))
+        if focus is not None:
+            source_branch_listwalker.set_focus(focus + 2)
+
+        source_branch_box = urwid.ListBox(source_branch_listwalker)
+        _set_urwid_widget(source_branch_box, _urwid_exit_on_q)
+    else:
+        _source_branch_chosen(user_args, None, source_branch)
+
+
+def _directory_chosen(user_args, directory):
+    # GitPython is slow to import so is only imported once a repository
+    # has been chosen
+    import git
+
+    mp_summaries = user_args['mp_summaries']
+
+    repo = git.Repo(directory)
+    checkedout_name = None
+    try:
+        checkedout_name = getattr(repo.active_branch, 'name', None)
+    except TypeError:
+        # This is OK, it more than likely means a detached HEAD
+        pass
+    # Branch names are looked up once as every access to
+    # repo.branches lists the refs again. No branches are created before
+    # the merge so the list never needs refreshing.
+    local_branches = [branch.name for branch in repo.branches]
+    branch_indexes = {local_branch: index for index, local_branch
+                      in enumerate(local_branches)}
+    user_args = dict(user_args,
+                     directory=directory,
+                     repo=repo,
+                     checkedout_name=checkedout_name,
+                     local_branches=local_branches,
+                     branch_indexes=branch_indexes)
+
+    buttons = []
+    for mp in mp_summaries:
+        button = urwid.Button(mp['summary'])
+        urwid.connect_signal(button, 'click', _mp_chosen, mp,
+                             user_args=[user_args])
+        buttons.append(button)
+    listwalker = urwid.SimpleFocusListWalker(
+            [urwid.Text(u'Merge Proposal to Merge'), urwid.Divider(),
+             *buttons])
+    mp_box = urwid.ListBox(listwalker)
+    _set_urwid_widget(mp_box, _urwid_exit_on_q)
 
 
 @click.command()
@@ -137,199 +477,16 @@ def lpshipit(directory, source_branch, target_branch, mp_owner, debug):
     lp_user = lp.me
 
     print('Retrieving Merge Proposals from Launchpad...')
-    person = lp.people[lp_user.name if mp_owner is None else mp_owner]
-    mps = person.getMergeProposals(status=['Needs review', 'Approved'])
+    mps = _get_merge_proposals(
+            lp_user, lp_user.name if mp_owner is None else mp_owner)
     if debug:
         print('Debug: Launchad returned {} merge proposals'.format(len(mps)))
     mp_summaries = summarize_git_mps(mps)
 
     if mp_summaries:
-
-        def urwid_exit_on_q(key):
-            if key in ('q', 'Q'):
-                raise urwid.ExitMainLoop()
-
-        def urwid_exit_program(button):
-            raise urwid.ExitMainLoop()
-
-        def mp_chosen(user_args, button, chosen_mp):
-            source_branch, target_branch, directory, repo, checkedout_branch =\
-                user_args['source_branch'], \
-                user_args['target_branch'], \
-                user_args['directory'], \
-                user_args['repo'], \
-                user_args['checkedout_branch']
-
-            local_branches = [branch.name for branch in repo.branches]
-
-            def source_branch_chosen(user_args, button, chosen_source_branch):
-                chosen_mp, target_branch, directory, repo, checkedout_branch =\
-                    user_args['chosen_mp'], \
-                    user_args['target_branch'], \
-                    user_args['directory'], \
-                    user_args['repo'], \
-                    user_args['checkedout_branch']
-
-                def target_branch_chosen(user_args, button, target_branch):
-                    source_branch, chosen_mp, directory, repo, \
-                    checkedout_branch = \
-                        user_args['source_branch'], \
-                        user_args['chosen_mp'], \
-                        user_args['directory'], \
-                        user_args['repo'], \
-                        user_args['checkedout_branch']
-
-                    if target_branch != source_branch:
-                        local_git = git.Git(directory)
-
-                        commit_message = build_commit_msg(
-                                author=chosen_mp['author'],
-                                reviewers=",".join(
-                                        chosen_mp['reviewers']),
-                                source_branch=source_branch,
-                                target_branch=target_branch,
-                                commit_message=chosen_mp[
-                                    'commit_message'],
-                                mp_web_link=chosen_mp['web']
-                        )
-
-                        repo.branches[target_branch].checkout()
-
-                        local_git.execute(
-                                ["git", "merge", "--no-ff", source_branch,
-                                 "-m", commit_message])
-
-                        merge_summary = "{source_branch} has been merged " \
-                                        "in to {target_branch} \nChanges " \
-                                        "have _NOT_ been pushed".format(
-                                        source_branch=source_branch,
-                                        target_branch=target_branch
-                                        )
-
-                        merge_summary_listwalker = urwid.SimpleFocusListWalker(
-                            list())
-                        merge_summary_listwalker.append(
-                                urwid.Text(u'Merge Summary'))
-                        merge_summary_listwalker.append(
-                                urwid.Divider())
-                        merge_summary_listwalker.append(
-                                urwid.Text(merge_summary))
-                        merge_summary_listwalker.append(
-                                urwid.Divider())
-                        button = urwid.Button("Exit")
-                        urwid.connect_signal(button,
-                                             'click',
-                                             urwid_exit_program)
-                        merge_summary_listwalker.append(button)
-                        merge_summary_box = urwid.ListBox(
-                                merge_summary_listwalker)
-                        _set_urwid_widget(merge_summary_box,
-                                          urwid_exit_on_q)
-                    else:
-                        error_text = urwid.Text('Source branch and target '
-                                                'branch can not be the same. '
-                                                '\n\nPress Q to exit.')
-                        error_box = urwid.Filler(error_text, 'top')
-                        _set_urwid_widget(error_box, urwid_exit_on_q)
-
-                user_args = {'chosen_mp': chosen_mp,
-                             'source_branch': chosen_source_branch,
-                             'directory': directory,
-                             'repo': repo,
-                             'checkedout_branch': checkedout_branch}
-                if not target_branch:
-                    target_branch_listwalker = urwid.SimpleFocusListWalker(
-                        list())
-                    target_branch_listwalker.append(
-                            urwid.Text(u'Target Branch'))
-                    target_branch_listwalker.append(urwid.Divider())
-                    focus_counter = 1
-                    focus = None
-                    for local_branch in local_branches:
-                        focus_counter = focus_counter + 1
-                        button = urwid.Button(local_branch)
-                        urwid.connect_signal(button,
-                                             'click',
-                                             target_branch_chosen,
-                                             local_branch,
-                                             user_args=[user_args])
-                        target_branch_listwalker.append(button)
-
-                        if local_branch == chosen_mp['target_branch']:
-                            focus = focus_counter
-                        if checkedout_branch \
-                                and hasattr(checkedout_branch, 'name') \
-                                and local_branch == checkedout_branch.name \
-                                and focus is None:
-                            focus = focus_counter
-
-                    if focus:
-                        target_branch_listwalker.set_focus(focus)
-
-                    target_branch_box = urwid.ListBox(target_branch_listwalker)
-                    _set_urwid_widget(target_branch_box, urwid_exit_on_q)
-                else:
-                    target_branch_chosen(user_args, None, target_branch)
-            user_args = {'chosen_mp': chosen_mp,
-                         'target_branch': target_branch,
-                         'directory': directory,
-                         'repo': repo,
-                         'checkedout_branch': checkedout_branch}
-            if not source_branch:
-                source_branch_listwalker = urwid.SimpleFocusListWalker(list())
-                source_branch_listwalker.append(urwid.Text(u'Source Branch'))
-                source_branch_listwalker.append(urwid.Divider())
-                focus_counter = 1
-                focus = None
-                for local_branch in local_branches:
-                    focus_counter = focus_counter + 1
-                    button = urwid.Button(local_branch)
-                    urwid.connect_signal(button, 'click',
-                                         source_branch_chosen,
-                                         local_branch,
-                                         user_args=[user_args])
-                    source_branch_listwalker.append(button)
-                    if local_branch == chosen_mp['source_branch']:
-                        focus = focus_counter
-                    if checkedout_branch \
-                            and hasattr(checkedout_branch, 'name') \
-                            and local_branch == checkedout_branch.name \
-                            and focus is None:
-                        focus = focus_counter
-
-                if focus:
-                    source_branch_listwalker.set_focus(focus)
-
-                source_branch_box = urwid.ListBox(source_branch_listwalker)
-                _set_urwid_widget(source_branch_box, urwid_exit_on_q)
-            else:
-                source_branch_chosen(user_args, None, source_branch)
-
-        def directory_chosen(directory):
-            repo = git.Repo(directory)
-            checkedout_branch = None
-            try:
-                checkedout_branch = repo.active_branch
-            except TypeError:
-                # This is OK, it more than likely means a detached HEAD
-                pass
-            listwalker = urwid.SimpleFocusListWalker(list())
-            listwalker.append(urwid.Text(u'Merge Proposal to Merge'))
-            listwalker.append(urwid.Divider())
-            user_args = {'source_branch': source_branch,
-                         'target_branch': target_branch,
-                         'directory': directory,
-                         'repo': repo,
-                         'checkedout_branch': checkedout_branch
-                         }
-
-            for mp in mp_summaries:
-                button = urwid.Button(mp['summary'])
-                urwid.connect_signal(button, 'click', mp_chosen, mp,
-                                     user_args=[user_args])
-                listwalker.append(button)
-            mp_box = urwid.ListBox(listwalker)
-            _set_urwid_widget(mp_box, urwid_exit_on_q)
+        user_args = {'source_branch': source_branch,
+                     'target_branch': target_branch,
+                     'mp_summaries': mp_summaries}
 
         if not directory:
             class GetDirectoryBox(urwid.Filler):
@@ -340,29 +497,29 @@ def lpshipit(directory, source_branch, target_branch, mp_owner, debug):
                     if chosen_directory == '':
                         chosen_directory = os.getcwd()
                     if os.path.isdir(chosen_directory):
-                        directory_chosen(chosen_directory)
+                        _directory_chosen(user_args, chosen_directory)
                     else:
                         error_text = urwid.Text('{} is not a valid directory. '
                                                 '\n\nPress Q to exit.'
                                                 .format(chosen_directory))
                         error_box = urwid.Filler(error_text, 'top')
-                        _set_urwid_widget(error_box, urwid_exit_on_q)
+                        _set_urwid_widget(error_box, _urwid_exit_on_q)
 
             directory_q = urwid.Edit(
                     u"Which directory [{current_directory}]?\n".format(
                             current_directory=os.getcwd()
                     ))
             fill = GetDirectoryBox(directory_q, 'top')
-            _set_urwid_widget(fill, urwid_exit_on_q)
+            _set_urwid_widget(fill, _urwid_exit_on_q)
         else:
             if os.path.isdir(directory):
-                directory_chosen(directory)
+                _directory_chosen(user_args, directory)
             else:
                 error_text = urwid.Text('{} is not a valid directory. '
                                         '\n\nPress Q to exit.'
                                         .format(directory))
                 error_box = urwid.Filler(error_text, 'top')
-                _set_urwid_widget(error_box, urwid_exit_on_q)
+                _set_urwid_widget(error_box, _urwid_exit_on_q)
 
     else:
         print("You have no Merge Proposals in either "